@@ -0,0 +1,105 @@
+import functools
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+
+SCHEMA_FILE = Path('ARCH_DOCS/Schema.txt')
+CACHE_FILE = Path('.cache/schema.json')
+# bump whenever the parse output changes so existing sidecars are rebuilt
+CACHE_VERSION = 1
+
+TABLE_START_RE = re.compile(r"^[ \t]*CREATE TABLE public\.([^(\s]+)\s*\(", re.M)
+# only what can change paren depth: parens, quote openers and -- line comments
+PAREN_TOKEN_RE = re.compile(r"""--[^\n]*|[()'"]""")
+# one match per column line: name, then the type/default text up to the first comma
+COL_RE = re.compile(r"^[ \t]*([A-Za-z0-9_]+)[ \t]+([^,\n]+)", re.M)
+PK_RE = re.compile(r"PRIMARY KEY \(([^)]+)\)")
+FK_RE = re.compile(r"FOREIGN KEY \(([^)]+)\) REFERENCES public\.([^(\s]+)\(([^)]+)\)")
+
+
+def iter_tables(sql):
+    """Yield (name, body) for each CREATE TABLE, matching its closing paren."""
+    end = 0
+    for m in TABLE_START_RE.finditer(sql):
+        if m.start() < end:
+            continue
+        name = m.group(1)
+        depth = 1
+        pos = m.end()
+        while depth:
+            tok = PAREN_TOKEN_RE.search(sql, pos)
+            if tok is None:
+                raise ValueError(f"CREATE TABLE public.{name}: no closing parenthesis found")
+            pos = tok.end()
+            t = tok.group()
+            if t in '\'"':
+                # jump to the closing quote; a doubled '' just reopens on the next pass
+                close = sql.find(t, pos)
+                if close < 0:
+                    raise ValueError(f"CREATE TABLE public.{name}: unterminated {t} quote")
+                pos = close + 1
+            elif t == '(':
+                depth += 1
+            elif t == ')':
+                depth -= 1
+            # anything else is a -- comment, skipped whole
+        end = pos
+        yield name, sql[m.end():pos - 1]
+
+
+@functools.lru_cache(maxsize=4)
+def _parse(path, mtime_ns):
+    sql = Path(path).read_bytes().decode('utf-8')
+    tables = {}
+    for name, body in iter_tables(sql):
+        cols = [(col, rest.strip()) for col, rest in COL_RE.findall(body)
+                if not col.upper().startswith('CONSTRAINT')]
+        pks = []
+        pkms = PK_RE.findall(body)
+        if pkms:
+            pks = [c.strip() for c in pkms[-1].split(',')]
+        fks = []
+        for fk_cols, ref_table, ref_cols in FK_RE.findall(body):
+            for a,b in zip(fk_cols.split(','), ref_cols.split(',')):
+                fks.append({'col': a.strip(), 'ref_table': ref_table, 'ref_col': b.strip()})
+        tables[name] = {'cols': cols, 'pks': pks, 'fks': fks}
+    return tables
+
+
+def write_cache(path=SCHEMA_FILE, cache_file=CACHE_FILE):
+    st = os.stat(path)
+    tables = _parse(str(path), st.st_mtime_ns)
+    data = {'version': CACHE_VERSION, 'schema': str(path), 'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'tables': tables}
+    payload = json.dumps(data)
+    tmp = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # per-writer temp file so concurrent tools never replace a half-written sidecar
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_file.parent,
+                                         suffix='.tmp', delete=False) as tmp:
+            tmp.write(payload)
+        os.replace(tmp.name, cache_file)
+    except OSError:
+        # read-only checkout: the parse result is still good, just not persisted
+        if tmp is not None and os.path.exists(tmp.name):
+            os.unlink(tmp.name)
+    # same JSON shape (lists, fresh objects) as a sidecar hit, never the lru_cache'd dict
+    return json.loads(payload)['tables']
+
+
+def load_schema_cached(path=SCHEMA_FILE, cache_file=CACHE_FILE):
+    st = os.stat(path)
+    try:
+        data = json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        data = None
+    if (data and data.get('version') == CACHE_VERSION and data.get('schema') == str(path)
+            and data.get('mtime_ns') == st.st_mtime_ns and data.get('size') == st.st_size):
+        return data['tables']
+    return write_cache(path, cache_file)
+
+
+def load_tables_cached(path=SCHEMA_FILE, cache_file=CACHE_FILE):
+    return {name: [col for col, _ in info['cols']] for name, info in load_schema_cached(path, cache_file).items()}
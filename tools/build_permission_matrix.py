@@ -1,37 +1,22 @@
 import json
-import re
 from pathlib import Path
 
-TOOL_FILE = Path('ARCH_DOCS/TOOL_TABLE_ALIGNMENT')
-SCHEMA_FILE = Path('ARCH_DOCS/Schema.txt')
+from _schema_cache import load_tables_cached
 
-tool = json.loads(TOOL_FILE.read_text(encoding='utf-8'))
-schema_sql = SCHEMA_FILE.read_text(encoding='utf-8')
+TOOL_FILE = Path('ARCH_DOCS/TOOL_TABLE_ALIGNMENT')
 
-# parse schema table columns
-pattern = re.compile(r"CREATE TABLE public\.([^(\s]+) \((.*?)\);", re.S)
-tables = {}
-for m in pattern.finditer(schema_sql):
-    name = m.group(1)
-    body = m.group(2)
-    lines = [l.strip() for l in body.splitlines()]
-    cols = []
-    for ln in lines:
-        if ln.upper().startswith('CONSTRAINT'):
-            continue
-        colm = re.match(r"([a-zA-Z0-9_]+)\s+([^,]+),?", ln)
-        if colm:
-            cols.append(colm.group(1))
-    tables[name] = cols
+tool = json.loads(TOOL_FILE.read_bytes())
+tables = load_tables_cached()
+tables_sets = {t: frozenset(c) for t, c in tables.items()}
 
 # Build updated matrix
 updated = {}
 for tbl, perms in tool.items():
     # ensure table exists in schema
-    if tbl not in tables:
+    if tbl not in tables_sets:
         # skip unknown tables
         continue
-    schema_cols = set(tables[tbl])
+    schema_cols = tables_sets[tbl]
     updated[tbl] = {}
     for op in ['GET','POST','PUT','DELETE']:
         cols = perms.get(op, [])
@@ -57,11 +42,12 @@ for required in ['calls','ai_runs']:
 # validation: ensure no extra columns
 errors = []
 for tbl, perms in updated.items():
+    schema_cols = tables_sets.get(tbl, frozenset())
     for op, cols in perms.items():
         if op == 'allowed_modules':
             continue
         for c in cols:
-            if c not in tables.get(tbl, []):
+            if c not in schema_cols:
                 errors.append(f"{tbl}.{op} includes unknown column {c}")
 
 out = {
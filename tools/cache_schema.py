@@ -0,0 +1,5 @@
+from _schema_cache import CACHE_FILE, SCHEMA_FILE, load_schema_cached
+
+# refresh the parsed-schema sidecar if Schema.txt changed since it was written
+tables = load_schema_cached()
+print(f"{CACHE_FILE}: {len(tables)} tables from {SCHEMA_FILE}")
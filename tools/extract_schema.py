@@ -1,65 +1,30 @@
-import re
-from pathlib import Path
+from _schema_cache import load_schema_cached
 
-SCHEMA_FILE = Path("ARCH_DOCS/Schema.txt")
+tables = load_schema_cached()
 
-sql = SCHEMA_FILE.read_text(encoding='utf-8')
-
-pattern = re.compile(r"CREATE TABLE public\.([^(\s]+) \((.*?)\);", re.S)
-
-tables = {}
-for m in pattern.finditer(sql):
-    name = m.group(1)
-    body = m.group(2)
-    lines = [l.strip() for l in body.splitlines()]
-    cols = []
-    pks = []
-    fks = []
-    for ln in lines:
-        if ln.upper().startswith('CONSTRAINT'):
-            # primary key
-            pkm = re.search(r"PRIMARY KEY \(([^)]+)\)", ln)
-            if pkm:
-                pks = [c.strip() for c in pkm.group(1).split(',')]
-            fkm = re.search(r"FOREIGN KEY \(([^)]+)\) REFERENCES public\.([^(\s]+)\(([^)]+)\)", ln)
-            if fkm:
-                fk_cols = [c.strip() for c in fkm.group(1).split(',')]
-                ref_table = fkm.group(2)
-                ref_cols = [c.strip() for c in fkm.group(3).split(',')]
-                for a,b in zip(fk_cols, ref_cols):
-                    fks.append({'col': a, 'ref_table': ref_table, 'ref_col': b})
-            continue
-        # column lines: name type ...
-        colm = re.match(r"([a-zA-Z0-9_]+)\s+([^,]+),?", ln)
-        if colm:
-            col = colm.group(1)
-            rest = colm.group(2).strip()
-            cols.append((col, rest))
-    tables[name] = {'cols': cols, 'pks': pks, 'fks': fks}
+# (prefix, ts type) in match order; 'int' also covers 'integer'
+_TYPE_PREFIX = (
+    ('uuid', 'string'),
+    ('text', 'string'),
+    ('character', 'string'),
+    ('timestamp', 'string'),
+    ('jsonb', 'any'),
+    ('int', 'number'),
+    ('bigint', 'number'),
+    ('boolean', 'boolean'),
+    ('numeric', 'number'),
+    ('array', 'any[]'),
+)
 
 def sqltype_to_ts(sqltype: str) -> str:
     t = sqltype.lower()
-    if t.startswith('uuid'):
-        return 'string'
-    if t.startswith('text') or t.startswith('character'):
-        return 'string'
+    for prefix, ts_type in _TYPE_PREFIX:
+        if t.startswith(prefix):
+            return ts_type
     if 'timestamp' in t:
         return 'string'
-    if t.startswith('jsonb'):
-        return 'any'
-    if t.startswith('integer') or t.startswith('int'):
-        return 'number'
-    if t.startswith('bigint'):
-        return 'number'
-    if t.startswith('boolean'):
-        return 'boolean'
-    if t.startswith('numeric'):
-        return 'number'
-    if t.startswith('array') or 'array' in t or t.endswith('[]'):
+    if 'array' in t or t.endswith('[]'):
         return 'any[]'
-    if 'default' in t or 'check' in t or 'constraint' in t:
-        # fallback for complex
-        return 'any'
     return 'any'
 
 req_tables = ['calls','recordings','scored_recordings','evidence_manifests','ai_runs','organizations','users','audit_logs']
@@ -0,0 +1,51 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import _schema_cache
+from _schema_cache import _parse, iter_tables, load_schema_cached
+
+FIXTURE = Path(__file__).parent / 'testdata' / 'schema_with_comments.txt'
+
+
+class IterTablesTest(unittest.TestCase):
+    def test_comments_and_quotes_do_not_drop_tables(self):
+        tables = _parse(str(FIXTURE), FIXTURE.stat().st_mtime_ns)
+        self.assertEqual(list(tables), ['organizations', 'users'])
+        self.assertEqual([c for c, _ in tables['organizations']['cols']], ['id', 'name', 'plan'])
+        self.assertEqual([c for c, _ in tables['users']['cols']], ['id', 'email', 'organization_id'])
+        self.assertEqual(tables['users']['pks'], ['id'])
+        self.assertEqual(tables['users']['fks'], [{'col': 'organization_id', 'ref_table': 'organizations', 'ref_col': 'id'}])
+
+    def test_unclosed_table_is_an_error(self):
+        with self.assertRaisesRegex(ValueError, 'public.broken'):
+            list(iter_tables("CREATE TABLE public.broken (\n  id uuid -- no close\n"))
+
+
+class SchemaSidecarTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_file = Path(tmp.name) / 'schema.json'
+
+    def test_sidecar_from_older_parser_is_rebuilt(self):
+        load_schema_cached(FIXTURE, self.cache_file)
+        data = json.loads(self.cache_file.read_bytes())
+        self.assertEqual(data['version'], _schema_cache.CACHE_VERSION)
+        data['version'] -= 1
+        data['tables'] = {}
+        self.cache_file.write_text(json.dumps(data), encoding='utf-8')
+        self.assertEqual(list(load_schema_cached(FIXTURE, self.cache_file)), ['organizations', 'users'])
+
+
+    def test_cold_and_warm_loads_return_the_same_shape(self):
+        cold = load_schema_cached(FIXTURE, self.cache_file)
+        warm = load_schema_cached(FIXTURE, self.cache_file)
+        self.assertEqual(cold, warm)
+        self.assertIsInstance(cold['users']['cols'][0], list)
+        self.assertEqual([p.name for p in self.cache_file.parent.iterdir()], ['schema.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
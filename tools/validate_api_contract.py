@@ -1,24 +1,6 @@
-import re
-from pathlib import Path
 import json
 
-SCHEMA_FILE = Path('ARCH_DOCS/Schema.txt')
-sql = SCHEMA_FILE.read_text(encoding='utf-8')
-
-pattern = re.compile(r"CREATE TABLE public\.([^(\s]+) \((.*?)\);", re.S)
-tables = {}
-for m in pattern.finditer(sql):
-    name = m.group(1)
-    body = m.group(2)
-    lines = [l.strip() for l in body.splitlines()]
-    cols = []
-    for ln in lines:
-        if ln.upper().startswith('CONSTRAINT'):
-            continue
-        colm = re.match(r"([a-zA-Z0-9_]+)\s+([^,]+),?", ln)
-        if colm:
-            cols.append(colm.group(1))
-    tables[name] = cols
+from _schema_cache import load_tables_cached
 
 # Define API contract references
 api = {
@@ -63,16 +45,27 @@ api = {
     }
 }
 
+# flatten the contract once: (action, mode, table, columns in contract order)
+WORK = tuple(
+    (action, mode, tbl, tuple(cols))
+    for action, ops in api.items()
+    for mode in ('reads', 'writes')
+    for tbl, cols in ops.get(mode, {}).items()
+)
+
+tables = load_tables_cached()
+tables_sets = {t: frozenset(c) for t, c in tables.items()}
+
 errors = []
-for action, ops in api.items():
-    for mode in ['reads','writes']:
-        for tbl, cols in ops.get(mode, {}).items():
-            if tbl not in tables:
-                errors.append(f"Action {action} references missing table {tbl}")
-                continue
-            for c in cols:
-                if c not in tables[tbl]:
-                    errors.append(f"Action {action} references missing column {tbl}.{c}")
+for action, mode, tbl, cols in WORK:
+    schema_cols = tables_sets.get(tbl)
+    if schema_cols is None:
+        errors.append(f"Action {action} references missing table {tbl}")
+        continue
+    # keep contract order so the report is stable between runs
+    for c in cols:
+        if c not in schema_cols:
+            errors.append(f"Action {action} references missing column {tbl}.{c}")
 
 result = {'valid': len(errors)==0, 'errors': errors}
 print(json.dumps(result, indent=2))